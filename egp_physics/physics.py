@@ -1,10 +1,10 @@
 """The operation that can be performed on a GC dictionary."""
 from copy import copy, deepcopy
+from functools import lru_cache
 from logging import DEBUG, NullHandler, getLogger
 from pprint import pformat
-from random import randint, choice
-from numpy import array, float32, isfinite
-from numpy.random import choice as weighted_choice
+from random import randint, choice, choices
+from numpy import array, float64, isfinite
 from collections.abc import Iterable
 from typing import Union
 
@@ -20,26 +20,31 @@ _logger.addHandler(NullHandler())
 _LOG_DEBUG = _logger.isEnabledFor(DEBUG)
 
 # Steady state exception filters.
-_EXCLUSION_LIMIT =  ' AND NOT ({exclude_column} = ANY({exclusions})) ORDER BY RANDOM() LIMIT 1'
+# ORDER BY RANDOM() LIMIT 1 is a bounded top-N sort.
+_EXCLUSIONS = ' AND {exclude_column} <> ALL({exclusions})'
+_RANDOM_ROW = ' ORDER BY RANDOM() LIMIT 1'
 
 # TODO: Replace with a localisation hash?
-_MATCH_TYPE_0_SQL = ('WHERE {input_types} = {itypes}::SMALLINT[] AND {inputs} = {iidx} AND {output_types} = {otypes}::SMALLINT[] AND {outputs} = {oidx}'
-                     + _EXCLUSION_LIMIT)
-_MATCH_TYPE_1_SQL = 'WHERE {input_types} = {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[] AND {outputs} = {oidx}' + _EXCLUSION_LIMIT
-_MATCH_TYPE_2_SQL = 'WHERE {input_types} = {itypes}::SMALLINT[] AND {inputs} = {iidx} AND {output_types} = {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_3_SQL = 'WHERE {input_types} = {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_4_SQL = 'WHERE {input_types} <@ {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_5_SQL = 'WHERE {input_types} <@ {itypes}::SMALLINT[] AND {output_types} @> {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_6_SQL = 'WHERE {input_types} <@ {itypes}::SMALLINT[] AND {output_types} && {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_7_SQL = 'WHERE {input_types} && {itypes}::SMALLINT[] AND {output_types} && {otypes}::SMALLINT[]' + _EXCLUSION_LIMIT
-_MATCH_TYPE_8_SQL = 'WHERE {output_types} && {otypes}::SMALLINT[] ' + _EXCLUSION_LIMIT
-_MATCH_TYPE_9_SQL = 'WHERE {input_types} && {itypes}::SMALLINT[] ' + _EXCLUSION_LIMIT
+# Every array predicate below has the column on the left of =, <@, @> or &&. These are all
+# operators of the default GIN array_ops operator class so a GIN index on input_types and
+# output_types can serve all the match types. Keep the column on the left when adding new ones.
+_MATCH_TYPE_0_SQL = ('{input_types} = {itypes}::SMALLINT[] AND {inputs} = {iidx} AND {output_types} = {otypes}::SMALLINT[]'
+                     ' AND {outputs} = {oidx}')
+_MATCH_TYPE_1_SQL = '{input_types} = {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[] AND {outputs} = {oidx}'
+_MATCH_TYPE_2_SQL = '{input_types} = {itypes}::SMALLINT[] AND {inputs} = {iidx} AND {output_types} = {otypes}::SMALLINT[]'
+_MATCH_TYPE_3_SQL = '{input_types} = {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[]'
+_MATCH_TYPE_4_SQL = '{input_types} <@ {itypes}::SMALLINT[] AND {output_types} = {otypes}::SMALLINT[]'
+_MATCH_TYPE_5_SQL = '{input_types} <@ {itypes}::SMALLINT[] AND {output_types} @> {otypes}::SMALLINT[]'
+_MATCH_TYPE_6_SQL = '{input_types} <@ {itypes}::SMALLINT[] AND {output_types} && {otypes}::SMALLINT[]'
+_MATCH_TYPE_7_SQL = '{input_types} && {itypes}::SMALLINT[] AND {output_types} && {otypes}::SMALLINT[]'
+_MATCH_TYPE_8_SQL = '{output_types} && {otypes}::SMALLINT[]'
+_MATCH_TYPE_9_SQL = '{input_types} && {itypes}::SMALLINT[]'
 # Catch for when xtypes is an empty set.
-_MATCH_TYPE_10_SQL = 'WHERE {output_types} = {otypes}::SMALLINT[] ' + _EXCLUSION_LIMIT
-_MATCH_TYPE_11_SQL = 'WHERE {input_types} = {itypes}::SMALLINT[] ' + _EXCLUSION_LIMIT
+_MATCH_TYPE_10_SQL = '{output_types} = {otypes}::SMALLINT[]'
+_MATCH_TYPE_11_SQL = '{input_types} = {itypes}::SMALLINT[]'
 
 
-_MATCH_TYPES_SQL = (
+_MATCH_TYPES = (
     _MATCH_TYPE_0_SQL,
     _MATCH_TYPE_1_SQL,
     _MATCH_TYPE_2_SQL,
@@ -53,7 +58,12 @@ _MATCH_TYPES_SQL = (
     _MATCH_TYPE_10_SQL,
     _MATCH_TYPE_11_SQL
 )
-_NUM_MATCH_TYPES = len(_MATCH_TYPES_SQL)
+_NUM_MATCH_TYPES = len(_MATCH_TYPES)
+
+
+# Match type queries indexed by match type, with and without the exclusions predicate.
+_MATCH_TYPES_SQL = tuple(f'WHERE {predicate}{_EXCLUSIONS}{_RANDOM_ROW}' for predicate in _MATCH_TYPES)
+_MATCH_TYPES_NO_EXCLUSIONS_SQL = tuple(f'WHERE {predicate}{_RANDOM_ROW}' for predicate in _MATCH_TYPES)
 
 
 # PGC Constants
@@ -61,6 +71,14 @@ RANDOM_PGC_SIGNATURE = b'\x00'*32
 _PGC_PARENTAL_PROTECTION_FACTOR = 0.75
 _POPULATION_PARENTAL_PROTECTION_FACTOR = 0.75
 
+# select_pGC() categories: effective, positive & negative pGC's
+_PGC_CATEGORIES = (0, 1, 2)
+
+# Per layer initial values copied by pGC_inherit()
+_PGC_INHERITED_COUNTS = [2] * NUM_PGC_LAYERS
+_PGC_ZERO_COUNTS = [0] * NUM_PGC_LAYERS
+_PGC_ZERO_FLOATS = [0.0] * NUM_PGC_LAYERS
+
 
 def _copy_row(igc, rows, ep_type=None):
     """Copy the internal format definition of a row.
@@ -419,13 +437,22 @@ def stablize(gms, target_gc, insert_gc=None, above_row=None):  # noqa: C901
     (rgc, {ref: fgc}): List of fGC's. First FGC is the insert_gc followed by fgc's
     created to stabilise rgc.
     """
-    if target_gc['igraph'].has_f():
+    tgc_graph = target_gc['igraph']
+    if tgc_graph.has_f():
+        return (target_gc, {})
+
+    # If there is no gc_insert and the target is stable there is nothing to do.
+    # Checked before the target is copied as this is the common case.
+    if insert_gc is None and tgc_graph.is_stable():
+        if _LOG_DEBUG:
+            assert tgc_graph.validate()
+            _logger.debug('Target GC is stable & nothing to insert.')
         return (target_gc, {})
+
     if above_row is None:
         above_row = 'ABO'[randint(0, 2)]
 
-
-    rgc_graph = deepcopy(target_gc['igraph'])
+    rgc_graph = deepcopy(tgc_graph)
     rgc = {
         'graph': rgc_graph.app_graph,
         'igraph': rgc_graph,
@@ -436,14 +463,9 @@ def stablize(gms, target_gc, insert_gc=None, above_row=None):  # noqa: C901
         'gcb_ref': target_gc['gcb_ref']
     }
 
-    # If there is no gc_insert return the target if it is stable or
+    # If there is no gc_insert the target is unstable (see above) so
     # throw a steady state exception.
     if insert_gc is None:
-        if rgc_graph.is_stable():
-            if _LOG_DEBUG:
-                assert rgc_graph.validate()
-                _logger.debug('Target GC is stable & nothing to insert.')
-            return (target_gc, {})
         if _LOG_DEBUG: _logger.debug('Target GC is unstable & nothing to insert.')
         work_stack = [steady_state_exception(gms, rgc)]
     else:
@@ -680,14 +702,18 @@ def _clone(gc):
     -------
     (dict): Minimal clone of gc as a dict.
     """
+    # More efficient than reconstructing. The application graph is part of the
+    # igraph so there is no need to copy gc['graph'] separately.
+    igraph = deepcopy(gc['igraph'])
+    ref = gc['ref']
+    gca_ref = gc['gca_ref']
     return {
-        'ancestor_a_ref': gc['ref'],
+        'ancestor_a_ref': ref,
         # If gc is a codon then it does not have a GCA
-        'gca_ref': gc['gca_ref'] if gc['gca_ref'] is not None else gc['ref'],
+        'gca_ref': gca_ref if gca_ref is not None else ref,
         'gcb_ref': gc['gcb_ref'],
-        'graph': deepcopy(gc['graph']),
-        # More efficient than reconstructing
-        'igraph': deepcopy(gc['igraph'])
+        'graph': igraph.app_graph,
+        'igraph': igraph
     }
 
 
@@ -766,7 +792,8 @@ def _pgc_epilogue(gms, xgc):
             # TODO: Yuk - need to de-mush physics & GP. gGC is a GP concept not a GMS one
             # 7-May-2022: Hmmm! But GP is a GMS and should fallback to GL when looking for a GC
             # In fact gms in the parameters should be GP?
-            ggcs = gGC((rgc, *fgcs.values()))
+            # A stable xgc (the common case) creates no fGC's
+            ggcs = gGC((rgc, *fgcs.values()) if fgcs else (rgc,))
             return ggcs[0]
     return None
 
@@ -955,13 +982,11 @@ def proximity_select(gms, xputs):
     development) the selection process follows 2 steps.
 
         a) The type of match is randomly selected from the list defined by
-            _MATCH_TYPES_SQL using the proximity_weights data from the meta table.
+            _MATCH_TYPES_SQL with equal probability.
         b) From the candidates found by a) randomly select one*.
 
-    In the event no candidates are found for type of match N p_count will be incremented
-
-    for match N and type of match N+1 will be
-    attempted. If no matches are found for match type 3 then None is returned.
+    In the event no candidates are found for type of match N then type of match N+1
+    will be attempted. If no matches are found for the last match type then None is returned.
 
     TODO: *The performance of this function needs careful benchmarking. The higher index
     match types could return a lot of results for the random selection step.
@@ -982,7 +1007,7 @@ def proximity_select(gms, xputs):
 
     Returns
     -------
-    (int, dict): (match_type, agc) or None
+    (dict): agc or None
     """
     # TODO: Lots of short queries is inefficient. Ideas:
     #   a) Specific query support from GP local cache
@@ -990,18 +1015,36 @@ def proximity_select(gms, xputs):
     #   c) Cache general queries (but this means missing out on new options)
     #   d) Batch queries (but this is architecturally tricky)
     match_type = randint(0, _NUM_MATCH_TYPES - 1)
-    agc = tuple(gms.select(_MATCH_TYPES_SQL[match_type], literals=xputs))
-    while not agc and match_type < _NUM_MATCH_TYPES - 1:
+    match_types_sql = _MATCH_TYPES_SQL if xputs['exclusions'] else _MATCH_TYPES_NO_EXCLUSIONS_SQL
+    # The queries are LIMIT 1 so at most one row is returned.
+    agc = next(iter(gms.select(match_types_sql[match_type], literals=xputs)), None)
+    while agc is None and match_type < _NUM_MATCH_TYPES - 1:
         if _LOG_DEBUG:
             _logger.debug(f'Proximity selection match_type {match_type} found no candidates.')
         match_type += 1
-        agc = tuple(gms.select(_MATCH_TYPES_SQL[match_type], literals=xputs))
-    if agc:
-        if _LOG_DEBUG:
-            _logger.debug(f'Proximity selection match_type {match_type} found a candidate.')
-            _logger.debug(f"Candidate: {agc[0]}")
-        return agc[0]
-    return None
+        agc = next(iter(gms.select(match_types_sql[match_type], literals=xputs)), None)
+    if _LOG_DEBUG and agc is not None:
+        _logger.debug(f'Proximity selection match_type {match_type} found a candidate.')
+        _logger.debug(f"Candidate: {agc}")
+    return agc
+
+
+@lru_cache(maxsize=8192)
+def _interface_definition(xputs):
+    """Cached interface_definition() for endpoint types as integers.
+
+    The number of distinct interfaces is bounded so the results are cached.
+    The returned lists are shared between callers and must not be modified.
+
+    Args
+    ----
+    xputs (tuple(int)): Endpoint types in interface order.
+
+    Returns
+    -------
+    (list(int), list(int), list(int)): See interface_definition().
+    """
+    return interface_definition(xputs, vtype.EP_TYPE_INT)
 
 
 def steady_state_exception(gms, fgc):
@@ -1028,25 +1071,29 @@ def steady_state_exception(gms, fgc):
     if _LOG_DEBUG: _logger.debug(f"Steady state exception thrown for GC ref {ref_str(fgc['ref'])}.")
     fgc_graph = fgc['igraph']
 
-    # Find unconnected destination endpoints. Determine highest row & endpoint types.
-    dst_list = list(filter(fgc_graph.unreferenced_filter(fgc_graph.dst_filter()), fgc_graph.graph.values()))
+    # Find unconnected destination endpoints & all source endpoints in a single pass.
+    # Determine highest row & endpoint types.
     above_row = 'Z'
     outputs = []
-    for ep in dst_list:
-        if ep[ep_idx.ROW] < above_row:
-            above_row = ep[ep_idx.ROW]
-        outputs.append(ep[ep_idx.TYPE])
+    src_eps = []
+    for ep in fgc_graph.graph.values():
+        if ep[ep_idx.EP_TYPE] == SRC_EP:
+            src_eps.append(ep)
+        elif not ep[ep_idx.REFERENCED_BY]:
+            if ep[ep_idx.ROW] < above_row:
+                above_row = ep[ep_idx.ROW]
+            outputs.append(ep[ep_idx.TYPE])
 
     # Find viable source types above the highest row.
-    filter_func = fgc_graph.rows_filter(fgc_graph.src_rows[above_row], fgc_graph.src_filter())
-    inputs = list((ep[ep_idx.TYPE] for ep in filter(filter_func, fgc_graph.graph.values())))
+    src_rows = fgc_graph.src_rows[above_row]
+    inputs = [ep[ep_idx.TYPE] for ep in src_eps if ep[ep_idx.ROW] in src_rows]
 
     xputs = {
         'exclude_column': 'signature',
         'exclusions': list()
     }
-    _, xputs['itypes'], xputs['iidx'] = interface_definition(inputs, vtype.EP_TYPE_INT)
-    _, xputs['otypes'], xputs['oidx'] = interface_definition(outputs, vtype.EP_TYPE_INT)
+    _, xputs['itypes'], xputs['iidx'] = _interface_definition(tuple(inputs))
+    _, xputs['otypes'], xputs['oidx'] = _interface_definition(tuple(outputs))
 
     # Find a gc based on the criteria
     insert_gc = proximity_select(gms, xputs)
@@ -1071,7 +1118,8 @@ def create_SMS(gp, pgc, ggc):
     pgc (pGC): A physical GC that positively changed ggc's parent to create ggc.
     ggc (gGC): A target population individual.
     """
-    parent = gp.pool.get(ggc['ancestor_a_ref'])
+    pool_get = gp.pool.get
+    parent = pool_get(ggc['ancestor_a_ref'])
     lineage = [ggc, parent]
     assert pgc['ref'] == ggc['pgc_ref'], 'pGC providied did not create ggc!'
     parent['effective_pgc_refs'].append(pgc['ref'])
@@ -1083,7 +1131,7 @@ def create_SMS(gp, pgc, ggc):
         sms = gc_stack(gp, lineage[-1]['pgc_ref'], sms)
         increase += lineage[-2] - lineage[-1]
         parent['effective_pgc_refs'].append(sms['ref'])
-        lineage.append(gp.pool.get(lineage[-1]['ancestor_a_ref']))
+        lineage.append(pool_get(lineage[-1]['ancestor_a_ref']))
         if _LOG_DEBUG:
             assert is_pgc(sms), 'Super Mutation Sequence is not a pGC!'
 
@@ -1098,7 +1146,7 @@ def create_SMS(gp, pgc, ggc):
         increase += lineage[-2] - lineage[-1]
         if increase > 0.0:
             parent['effective_pgc_refs'].append(sms['ref'])
-        lineage.append(gp.pool.get(lineage[-1]['ancestor_a_ref']))
+        lineage.append(pool_get(lineage[-1]['ancestor_a_ref']))
         if _LOG_DEBUG:
             assert is_pgc(sms), 'Super Mutation Sequence is not a pGC!'
 
@@ -1137,13 +1185,19 @@ def pGC_fitness(gp: gene_pool_cache, pgc: _gGC, ggc: _gGC, delta_fitness:Union[f
     -------
     The number of pGC evolutions that occured as a result of the fitness update.
     """
+    pool_get = gp.pool.get
     depth = 0
     _pGC_fitness(pgc, ggc, delta_fitness, depth)
     delta_fitness = pgc['pgc_delta_fitness'][depth]
     evolved = evolve_physical(gp, pgc, depth)
     evolutions = int(evolved)
-    pgc_creator = gp.pool.get(pgc['pgc_ref'], None)
-    while evolved and pgc_creator is not None:
+
+    # The creator is only needed if its creation evolved. That is rare
+    # (once every M_CONSTANT uses) so do not look it up otherwise.
+    while evolved:
+        pgc_creator = pool_get(pgc['pgc_ref'], None)
+        if pgc_creator is None:
+            break
         depth += 1
         _pGC_evolvability(pgc_creator, delta_fitness, depth)
         _pGC_fitness(pgc_creator, pgc, delta_fitness, depth)
@@ -1151,7 +1205,6 @@ def pGC_fitness(gp: gene_pool_cache, pgc: _gGC, ggc: _gGC, delta_fitness:Union[f
         evolved = evolve_physical(gp, pgc_creator, depth)
         evolutions += evolved
         pgc = pgc_creator
-        pgc_creator = gp.pool.get(pgc_creator['pgc_ref'], None)
     return evolutions
 
 
@@ -1179,13 +1232,14 @@ def _pGC_fitness(pgc:_gGC, xgc:_gGC, delta_fitness:Union[float, None], depth:int
     -------
     Mapped delta_fitness 
     """
-    old_count = pgc['pgc_f_count'][depth]
-    pgc['pgc_f_count'][depth] += 1
+    f_count = pgc['pgc_f_count']
+    fitness = pgc['pgc_fitness']
+    new_count = f_count[depth] = f_count[depth] + 1
 
     if delta_fitness is None:
         delta_fitness = -1.0
 
-    pgc['pgc_fitness'][depth] = (old_count * pgc['pgc_fitness'][depth] + (delta_fitness / 2 + 0.5)) / pgc['pgc_f_count'][depth]
+    fitness[depth] += ((delta_fitness / 2 + 0.5) - fitness[depth]) / new_count
             
     return delta_fitness
 
@@ -1203,9 +1257,10 @@ def _pGC_evolvability(pgc, delta_fitness, depth):
     depth (int): The layer in the environment pgc is at.
     """
     increase = 0.0 if delta_fitness < 0 else delta_fitness
-    old_count = pgc['pgc_e_count'][depth]
-    pgc['pgc_e_count'][depth] += 1
-    pgc['pgc_evolvability'][depth] = (old_count * pgc['pgc_evolvability'][depth] + increase) / pgc['pgc_e_count'][depth]
+    e_count = pgc['pgc_e_count']
+    evolvability = pgc['pgc_evolvability']
+    new_count = e_count[depth] = e_count[depth] + 1
+    evolvability[depth] += (increase - evolvability[depth]) / new_count
 
 
 def population_GC_evolvability(xgc, delta_fitness):
@@ -1220,9 +1275,8 @@ def population_GC_evolvability(xgc, delta_fitness):
     delta_fitness (float): Difference in fitness between this GC & its offspring.
     """
     increase = 0.0 if delta_fitness < 0 else delta_fitness
-    old_count = xgc['e_count']
-    xgc['e_count'] += 1
-    xgc['evolvability'] = (old_count * xgc['evolvability'] + increase) / xgc['e_count']
+    new_count = xgc['e_count'] = xgc['e_count'] + 1
+    xgc['evolvability'] += (increase - xgc['evolvability']) / new_count
 
 
 def evolve_physical(gp, pgc, depth):
@@ -1254,14 +1308,12 @@ def evolve_physical(gp, pgc, depth):
         result = wrapped_ppgc_callable((pgc,))
         if result is None:
             # pGC went pop - should not happen very often
-            _logger.warning(f"ppGC {ref_str(pgc['ref'])} threw an exception when called.")
+            _logger.warning("ppGC %s threw an exception when called.", ref_str(pgc['ref']))
             offspring = None
         else:
             offspring = result[0]
 
         if offspring is not None:
-            if _LOG_DEBUG:
-                assert isinstance(offspring, _gGC)
             pGC_inherit(offspring, pgc, ppgc)
         return True
     return False
@@ -1281,6 +1333,7 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
     In the event that any of these categories has no
     pGC's in the weight is reduced to 0.
     NOTE: There can never be no pGC's in any category.
+    NOTE: Selections are drawn from the random module. Use random.seed() to repeat them.
 
     Args
     ----
@@ -1308,14 +1361,14 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
             # Selection category selection
             effective_category_weight = 0 if xgc['effective_pgc_refs'] is None else 4
             _weights = (effective_category_weight, positive_category_weight, negative_category_weight)
-            category_weights = array(_weights, dtype=float32)
-            normalised_category_weights = category_weights / category_weights.sum()
-            category = weighted_choice(3, p=normalised_category_weights)
+            category = choices(_PGC_CATEGORIES, weights=_weights)[0]
 
             # Only do this once if it is needed as it is expensive
             if category > 0:
                 if all_pgcs is None:
                     # TODO: Need a better data structure
+                    # NOTE: The *_cdf cumulative weights are built once per call and reused for
+                    # every xGC in that category.
                     # NOTE: *_weights have no bias so the probability of a pGC with fitness
                     # 0.501 being selected relative to a pGC of fitness 0.600 is 1% - that make sense
                     # at the time of writing.
@@ -1332,8 +1385,8 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
                         positive_pgcs = tuple(gc for gc in all_pgcs if gc['pgc_fitness'][depth] > 0.5)
                         redo = False
                         if positive_pgcs:
-                            positive_weights = array([pgc['pgc_fitness'][depth] for pgc in positive_pgcs], dtype=float32) - 0.5
-                            positive_normalised_weights = positive_weights / positive_weights.sum()
+                            positive_weights = array([pgc['pgc_fitness'][depth] for pgc in positive_pgcs], dtype=float64) - 0.5
+                            positive_cdf = positive_weights.cumsum().tolist()
                         else:
                             positive_category_weight = 0
                             category = 2
@@ -1342,7 +1395,7 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
                             assert positive_pgcs and all(isfinite(positive_weights)), "Not all positive pGCs have a finite weight!"
 
                     if category == 1:
-                        matched_pgcs.append(weighted_choice(positive_pgcs, p=positive_normalised_weights))
+                        matched_pgcs.append(choices(positive_pgcs, cum_weights=positive_cdf)[0])
                         break
 
                     # pGC's that have had a net negative affect on target fitness
@@ -1351,8 +1404,8 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
                     if negative_pgcs is None:
                         negative_pgcs = tuple(gc for gc in all_pgcs if gc['pgc_fitness'][depth] <= 0.5)
                         if negative_pgcs:
-                            negative_weights = array([pgc['pgc_fitness'][depth] for pgc in negative_pgcs], dtype=float32)
-                            negative_normalised_weights = negative_weights / negative_weights.sum()
+                            negative_weights = array([pgc['pgc_fitness'][depth] for pgc in negative_pgcs], dtype=float64)
+                            negative_cdf = negative_weights.cumsum().tolist()
                         else:
                             negative_category_weight = 0
                             category = 1
@@ -1361,7 +1414,7 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
                             assert negative_pgcs and all(isfinite(negative_weights)), "Not all negative pGCs have a finite weight!"
 
                     if category == 2:
-                        matched_pgcs.append(weighted_choice(negative_pgcs, p=negative_normalised_weights))
+                        matched_pgcs.append(choices(negative_pgcs, cum_weights=negative_cdf)[0])
                         break
  
                     # An effective category == 3 (would have broken out of the while loop before now if it wasn't)
@@ -1372,9 +1425,8 @@ def select_pGC(gp:gene_pool_cache, xgc_refs:Iterable[int], depth:int=0) -> list[
                         assert not negative_pgcs, "Category 3 pGC selection can only be reached if there are no negative pGCs!"
 
             else: # Category == 0
-                fitness = array(xgc['effective_pgc_fitness'], dtype=float32)
-                normalised_weights = fitness / fitness.sum()
-                matched_pgcs.append(gp[weighted_choice(xgc['effective_pgc_refs'], p=normalised_weights)])
+                effective_pgc_ref = choices(xgc['effective_pgc_refs'], weights=xgc['effective_pgc_fitness'])[0]
+                matched_pgcs.append(gp[effective_pgc_ref])
     
     return matched_pgcs
 
@@ -1397,14 +1449,14 @@ def pGC_inherit(child, parent, pgc):
     """
     # TODO: A better data structure would be quicker
     child['pgc_fitness'] = [f * _PGC_PARENTAL_PROTECTION_FACTOR for f in parent['pgc_fitness']]
-    child['pgc_f_count'] = [2] * NUM_PGC_LAYERS
+    child['pgc_f_count'] = _PGC_INHERITED_COUNTS.copy()
     child['pgc_evolvability'] = [f * _PGC_PARENTAL_PROTECTION_FACTOR for f in parent['pgc_evolvability']]
-    child['pgc_e_count'] = [2] * NUM_PGC_LAYERS
+    child['pgc_e_count'] = _PGC_INHERITED_COUNTS.copy()
 
-    child['_pgc_fitness'] = [0.0] * NUM_PGC_LAYERS
-    child['_pgc_f_count'] = [0] * NUM_PGC_LAYERS
-    child['_pgc_evolvability'] = [0.0] * NUM_PGC_LAYERS
-    child['_pgc_e_count'] = [0] * NUM_PGC_LAYERS
+    child['_pgc_fitness'] = _PGC_ZERO_FLOATS.copy()
+    child['_pgc_f_count'] = _PGC_ZERO_COUNTS.copy()
+    child['_pgc_evolvability'] = _PGC_ZERO_FLOATS.copy()
+    child['_pgc_e_count'] = _PGC_ZERO_COUNTS.copy()
 
     xGC_inherit(child, parent, pgc)
 
@@ -1430,12 +1482,13 @@ def population_GC_inherit(child, parent, pgc):
             raise ValueError('Child GC has not been characterized.')
 
     # There is no way of characterising first
-    if parent['e_count'] == 1:
+    parent_e_count = parent['e_count']
+    if parent_e_count == 1:
         child['evolvability'] = 1.0
         child['e_count'] = 1
     else:
         child['evolvability'] = parent['evolvability']
-        child['e_count'] = max((2, parent['e_count'] >> 1))
+        child['e_count'] = max((2, parent_e_count >> 1))
 
     inherited_survivability = parent['survivability'] * _POPULATION_PARENTAL_PROTECTION_FACTOR
     inherited_fitness = parent['fitness'] * _POPULATION_PARENTAL_PROTECTION_FACTOR
@@ -1462,7 +1515,10 @@ def xGC_inherit(child, parent, pgc):
     child['ancestor_a_ref'] = parent['ref']
     child['pgc_ref'] = pgc['ref']
     child['generation'] = parent['generation'] + 1
-    child['effective_pgc_refs'] = copy(parent['effective_pgc_refs'])
-    child['effective_pgc_fitness'] = copy(parent['effective_pgc_fitness'])
+    # Slicing is a direct list copy. These fields may be None (see select_pGC()).
+    effective_pgc_refs = parent['effective_pgc_refs']
+    effective_pgc_fitness = parent['effective_pgc_fitness']
+    child['effective_pgc_refs'] = None if effective_pgc_refs is None else effective_pgc_refs[:]
+    child['effective_pgc_fitness'] = None if effective_pgc_fitness is None else effective_pgc_fitness[:]
 
     parent['offspring_count'] += 1